@@ -47,6 +47,11 @@ def invcm2Hz(val):
     return val * 100 * scipy.constants.speed_of_light
 
 
+def invcm2J(val):
+    """wavenumber (cm^{-1}) -> Joule"""
+    return Hz2J(invcm2Hz(val))
+
+
 def J2Hz(val):
     """Joule -> Hertz"""
     return np.array(val) / scipy.constants.Planck
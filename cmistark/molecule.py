@@ -18,6 +18,10 @@
 
 __author__ = "Jochen Küpper <jochen.kuepper@cfel.de>"
 
+import concurrent.futures
+import itertools
+import multiprocessing
+
 import numpy as np
 import numpy.linalg
 import tables
@@ -35,6 +39,21 @@ Masses = {'H': 1.0078250321, 'D': 2.01410178, '2H': 2.01410178,
           'I': 126.90447}
 Ordernumbers = {'H': 1, 'D': 1, 'C': 6, 'N': 7, 'O': 8, 'F': 9, 'S': 16, 'BR': 35, 'I': 53}
 
+# upper bound of any individual quantum number in a State and the corresponding decimal powers used
+# to encode the five quantum numbers in a single ID
+_MAX = 1000
+_POWERS = tuple(_MAX**i for i in range(5))
+
+# nuclear-spin-statistics selectors for State.nssw; the value of each constant is the bit position
+# of the corresponding parity in State.__parity
+FORBIDDEN_KA = 0
+FORBIDDEN_KB = 1
+FORBIDDEN_KC = 2
+_PARITY_BIT = {'Ka': FORBIDDEN_KA, 'Kb': FORBIDDEN_KB, 'Kc': FORBIDDEN_KC}
+
+# translation tables between the minus signs of quantum numbers and the 'n' used in HDF5 node names
+_HDF_DASH_TO_N = str.maketrans("-", "n")
+_HDF_N_TO_DASH = str.maketrans("n", "-")
 
 class _isomer_mass(tables.IsDescription):
     """Isomer mass represenation for pytables."""
@@ -43,6 +62,11 @@ class _isomer_mass(tables.IsDescription):
     mass  = tables.Float64Col()
 
 
+class _state_id(tables.IsDescription):
+    """State-ID representation for pytables -- index of the states stored in a file."""
+    id = tables.UInt64Col()
+
+
 
 class State:
     """State label of molecule
@@ -57,10 +81,15 @@ class State:
     on the case.
     """
 
+    # flat slot storage instead of a per-instance __dict__ -- calculations create tens of thousands
+    # of State objects
+    __slots__ = ('max', '__J', '__Ka', '__Kc', '__M', '__isomer', '__id', '__parity',
+                 '__symtop_sign', '__hdfname', '__name')
+
     def __init__(self, J=0, Ka=0, Kc=0, M=0, isomer=0):
-        self.max = 1000
-        self.__initialize(J, Ka, Kc, M, isomer)
+        self.max = _MAX
         self.__symtop_sign = 1
+        self.__initialize(J, Ka, Kc, M, isomer)
 
     def __initialize(self, J=0, Ka=0, Kc=0, M=0, isomer=0):
         """Store all info and creat a unique ID for the state.
@@ -72,54 +101,65 @@ class State:
         """
         assert ((0 <= J < self.max) and (abs(Ka) < self.max) and (abs(Kc) < self.max) and (0 <= M < self.max)
                 and (0 <= isomer < self.max))
-        self.__labels = np.array([J, Ka, Kc, M, isomer], dtype=np.int64)
-        self.__id = np.uint64(0)
-        for i in range(self.__labels.size):
-            self.__id += np.uint64(abs(self.__labels[i]) * self.max**i)
+        self.__J, self.__Ka, self.__Kc, self.__M, self.__isomer = int(J), int(Ka), int(Kc), int(M), int(isomer)
+        self.__hdfname = None
+        self.__name = None
+        # parities of Ka, Ka+Kc (= Kb), and Kc, packed into one int for the nssw lookup
+        self.__parity = ((self.__Ka & 1) | (((self.__Ka + self.__Kc) & 1) << 1) | ((self.__Kc & 1) << 2))
+        self.__id = (self.__J + abs(self.__Ka) * _POWERS[1] + abs(self.__Kc) * _POWERS[2]
+                     + self.__M * _POWERS[3] + self.__isomer * _POWERS[4])
         # handle negative sign of symmetric-top K*M
         if Ka < 0 or Kc < 0:
             self.__symtop_sign = -1
-            self.__id += np.uint64(1e15)
+            self.__id += 10**15
 
     def J(self):
-        return self.__labels[0]
+        return self.__J
 
     def Ka(self):
-        return self.__labels[1]
+        return self.__Ka
 
     def Kc(self):
-        return self.__labels[2]
+        return self.__Kc
 
     def M(self):
-        return self.__labels[3]
+        return self.__M
 
     def isomer(self):
-        return self.__labels[4]
+        return self.__isomer
 
     def nssw(self, forbidden):
-        """Give back nuclear spin weight 0 for nuclear-spin-statistically forbidden rve-states, 1 otherwise"""
-        if "Ka" == forbidden and self.Ka() % 2 == 1: return 0
-        if "Kb" == forbidden and (self.Ka() + self.Kc()) % 2 == 1: return 0
-        if "Kc" == forbidden and self.Kc() % 2 == 1: return 0
-        return 1
+        """Give back nuclear spin weight 0 for nuclear-spin-statistically forbidden rve-states, 1 otherwise
 
-    def symtop_sign():
+        ``forbidden`` is one of the FORBIDDEN_KA/FORBIDDEN_KB/FORBIDDEN_KC module constants -- hot
+        loops should pass these directly -- or, for backward compatibility, the corresponding
+        "Ka"/"Kb"/"Kc" string; any other value yields weight 1.
+        """
+        if not isinstance(forbidden, int):
+            forbidden = _PARITY_BIT.get(forbidden)
+            if forbidden is None:
+                return 1
+        return 1 - ((self.__parity >> forbidden) & 1)
+
+    def symtop_sign(self):
         return self.__symtop_sign
 
     def fromid(self, id):
         """Set quantum-numbers form id"""
-        id = np.int64(id)
+        id = int(id)
         self.__id = id
-        self.__labels = np.zeros((5,), dtype=np.int64)
+        self.__hdfname = None
+        self.__name = None
+        labels = [0, 0, 0, 0, 0]
         for i in range(5):
-            self.__labels[i] = id % self.max
-            id //= self.max
+            id, labels[i] = divmod(id, self.max)
         # handle negative sign of symmetric-top K*M
         self.__symtop_sign = id % 10
-        id //= 10
         if self.__symtop_sign > 0:
-            for i in [1,2]:
-                self.__labels[i] = -self.__labels[i]
+            labels[1] = -labels[1]
+            labels[2] = -labels[2]
+        self.__J, self.__Ka, self.__Kc, self.__M, self.__isomer = labels
+        self.__parity = ((self.__Ka & 1) | (((self.__Ka + self.__Kc) & 1) << 1) | ((self.__Kc & 1) << 2))
         return self
 
     def fromhdfname(self, hdfname):
@@ -129,17 +169,19 @@ class State:
 
         .. todo:: Implement symtop-sign usage
         """
-        name = hdfname.replace("n","-")
-        qn = np.array(name.split("/"))
-        J, Ka, Kc, M, iso = qn.tolist()
-        self.__initialize(np.int64(J[1:]), np.int64(Ka[1:]), np.int64(Kc[1:]), np.int64(M[1:]), np.int64(iso[1:]))
+        name = hdfname.translate(_HDF_N_TO_DASH)
+        J, Ka, Kc, M, iso = (int(qn[1:]) for qn in name.split("/"))
+        self.__initialize(J, Ka, Kc, M, iso)
         return self
 
     def id(self):
         return self.__id
 
     def name(self):
-        return "%d %d %d %d %d" % self.totuple()
+        """Human-readable name of the state; cached on first use, see hdfname()."""
+        if self.__name is None:
+            self.__name = "%d %d %d %d %d" % self.totuple()
+        return self.__name
 
     def hdfname(self):
         """Create HDF5 storage file name of state.
@@ -147,22 +189,33 @@ class State:
         Prepend '_' to all numbers to make them valid Python identifiers. We split the individual quantum numbers by '/'
         in order to provide subgrouping for faster transversal of the HDF5 directory.
 
+        The name is cached on first use, as the quantum numbers do not change after initialization.
+
         """
-        name = "_%d/_%d/_%d/_%d/_%d" % self.totuple()
-        name.replace("-","n")
-        return name.replace("-","n")
+        if self.__hdfname is None:
+            self.__hdfname = ("_%d/_%d/_%d/_%d/_%d" % self.totuple()).translate(_HDF_DASH_TO_N)
+        return self.__hdfname
 
     def toarray(self):
-        return self.__labels
+        return np.array(self.totuple(), dtype=np.int64)
 
     def tolist(self):
-        return self.__labels.tolist()
+        return list(self.totuple())
 
     def totuple(self):
-        return tuple(self.__labels.tolist())
+        return (self.__J, self.__Ka, self.__Kc, self.__M, self.__isomer)
+
 
 
 
+def _starkeffect_solve(rotor, param, M, dcfield):
+    """Solve the Stark problem of a single field strength and return its (ids, energies) arrays.
+
+    This is a module-level function so it can be pickled and dispatched to worker processes in
+    Molecule.starkeffect_calculation.
+    """
+    return rotor(param, M, dcfield).energies()
+
 
 class Molecule(object):
     """Representation of a Molecule"""
@@ -171,13 +224,74 @@ class Molecule(object):
         """Create Molecule """
         try:
             if readonly:
-                self.__storage = tables.open_file(storage, mode='r')
+                # readonly access is dominated by reading many small Stark-curve chunks; a larger
+                # HDF5 chunk cache keeps them resident across repeated starkeffect()/mueff() calls
+                self.__storage = tables.open_file(storage, mode='r', CHUNK_CACHE_SIZE=64*1024*1024)
             else:
                 self.__storage = tables.open_file(storage, mode='a', title=name)
                 self.__storage.get_node("/")._v_title = name
         except:
             raise EnvironmentError("Cannot create nor open storage file")
             self.__storage = None
+        # cache of state-storage Group nodes, keyed by State.hdfname(), to avoid re-traversing the
+        # HDF5 tree on every write
+        self.__groupcache = {}
+        # set of state IDs stored in the file, mirroring the /stateids table; filled on first use
+        self.__knownids = None
+
+
+    def __group(self, state):
+        """Get the storage group of ``state``, creating it on first access."""
+        name = state.hdfname()
+        group = self.__groupcache.get(name)
+        if group is None:
+            group = cmistark.storage.get_or_create_group(self.__storage, name)
+            self.__groupcache[name] = group
+        return group
+
+
+    def __stateid_table(self):
+        """Get the /stateids index table, creating and back-filling it from the group tree if missing.
+
+        The table stores the IDs of all states for which Stark curves are stored, so readers do not
+        have to walk the five-level group tree to enumerate them.
+        """
+        try:
+            return self.__storage.root.stateids
+        except tables.exceptions.NoSuchNodeError:
+            pass
+        table = self.__storage.create_table("/", 'stateids', _state_id, "State IDs")
+        row = table.row
+        for state in self.__walk_states():
+            row['id'] = state.id()
+            row.append()
+        table.flush()
+        return table
+
+
+    def __record_state(self, state):
+        """Add ``state`` to the /stateids index table unless it is known already."""
+        table = self.__stateid_table()
+        if self.__knownids is None:
+            self.__knownids = set(table.col('id'))
+        if state.id() not in self.__knownids:
+            row = table.row
+            row['id'] = state.id()
+            row.append()
+            self.__knownids.add(state.id())
+
+
+    def __walk_states(self):
+        """Enumerate the stored states by walking the group tree."""
+        states = []
+        # a single depth-first walk over the group tree replaces the five nested list_nodes()
+        # queries, so the HDF5 node table is traversed only once
+        for group in self.__storage.walk_nodes("/", classname='Group'):
+            if 5 != group._v_depth:
+                continue
+            if 'dcfield' in group and 'dcstarkenergy' in group:
+                states.append(State().fromhdfname(group._v_pathname[1:]))
+        return states
 
 
     def mueff(self, state):
@@ -195,10 +309,11 @@ class Molecule(object):
         """
         fields, energies = self.starkeffect(state)
         assert len(fields) == len(energies)
-        mueff = np.zeros((len(fields),), np.float64)
-        mueff[0]    = 0.
-        mueff[1:-1] = (energies[0:-2] - energies[2:]) / (fields[2:] - fields[0:-2])
-        mueff[-1]   = (energies[-2] - energies[-1]) / (fields[-1] - fields[-2])
+        # µ_eff = -dE/dF; np.gradient performs the central differences in one vectorized pass and
+        # the one-sided difference at the upper boundary
+        mueff = np.gradient(energies, fields, edge_order=1)
+        np.negative(mueff, out=mueff)
+        mueff[0] = 0.
         return fields, mueff
 
 
@@ -221,8 +336,10 @@ class Molecule(object):
             raise SyntaxError
         else:
             assert len(fields) == len(energies)
-            cmistark.storage.writeVLArray(self.__storage, "/" + state.hdfname(), "dcfield", fields)
-            cmistark.storage.writeVLArray(self.__storage, "/" + state.hdfname(), "dcstarkenergy", energies)
+            group = self.__group(state)
+            cmistark.storage.writeVLArray(self.__storage, group, "dcfield", fields)
+            cmistark.storage.writeVLArray(self.__storage, group, "dcstarkenergy", energies)
+            self.__record_state(state)
 
 
     def starkeffect_calculation(self, param):
@@ -234,45 +351,64 @@ class Molecule(object):
 
         """
         try:
-            self.__storage.create_table("/", 'masses', _isomer_mass, "Isomer masses")
+            masses = self.__storage.create_table("/", 'masses', _isomer_mass, "Isomer masses")
+            # index the isomer numbers so lookups are in-kernel searches instead of row scans
+            masses.cols.num.create_csindex()
         except:
             # Cannot create HDF5 table, continuing -- this is morst likely due to the fact that the
             # entry/file exists already
             pass
-        if 'L' == param.type:
-            Rotor = cmistark.starkeffect.LinearRotor
-        elif 'S' == param.type:
-            Rotor = cmistark.starkeffect.SymmetricRotor
-        elif 'A' == param.type:
-            Rotor = cmistark.starkeffect.AsymmetricRotor
-        else:
+        try:
+            Rotor = cmistark.starkeffect._ROTORS[param.type]
+        except KeyError:
             raise NotImplementedError("unknown rotor type in Stark energy calculation.")
         # calculate and store energies
         masses = self.__storage.root.masses
-        new_isomer = True
-        for isomer in masses.iterrows():
-            if isomer['num'] == param.isomer:
-                isomer['mass'] = param.mass
-                new_isomer = False
-        if new_isomer:
-            isomer = self.__storage.root.masses.row
+        mass = float(np.ravel(param.mass)[0])
+        rows = masses.get_where_list('num == isomer_num', condvars={'isomer_num': param.isomer})
+        if 0 == len(rows):
+            isomer = masses.row
             isomer['name'] = param.name
-            isomer['mass'] = param.mass
+            isomer['mass'] = mass
             isomer['num']  = param.isomer
             isomer.append()
+            masses.flush()
+        else:
+            # update the stored mass in place; the old row scan modified a detached row copy and
+            # never wrote the new mass back
+            masses.modify_column(start=rows[0], stop=rows[0]+1, column=[mass], colname='mass')
+        processes = int(getattr(param, 'processes', 1))
         for M in param.M:
-            energies = {}
-            for field in param.dcfields:
-                calc = Rotor(param, M, field)
-                for state in calc.states():
-                    id = state.id()
-                    if id in energies:
-                        energies[id].append(calc.energy(state))
-                    else:
-                        energies[id] = [calc.energy(state),]
-            # store calculated values for this M
-            for id in list(energies.keys()):
-                self.starkeffect_merge(State().fromid(id), param.dcfields, energies[id])
+            # the set of states is independent of the field strength -- set up the ID -> matrix-row
+            # mapping and the energy matrix once per M; the first field's rotor also provides
+            # column 0 of the energies below, so that field is solved only once
+            calc = Rotor(param, M, param.dcfields[0])
+            states = calc.states()
+            ids = np.array([state.id() for state in states], dtype=np.uint64)
+            roworder = np.argsort(ids)
+            sortedids = ids[roworder]
+            energies = np.empty((len(states), len(param.dcfields)), np.float64)
+            if processes > 1:
+                # the remaining fields are independent eigenvalue problems -- solve them in
+                # parallel; our consumers pass the CalculationParameter class itself with mutated
+                # class attributes, which pickle serializes by reference, so the workers must
+                # inherit the parameter values by fork rather than re-import pristine defaults
+                with concurrent.futures.ProcessPoolExecutor(
+                        max_workers=processes,
+                        mp_context=multiprocessing.get_context('fork')) as executor:
+                    results = list(executor.map(_starkeffect_solve, itertools.repeat(Rotor),
+                                                itertools.repeat(param), itertools.repeat(M),
+                                                param.dcfields[1:]))
+            else:
+                results = (_starkeffect_solve(Rotor, param, M, field) for field in param.dcfields[1:])
+            for col, (fieldids, fieldenergies) in enumerate(itertools.chain([calc.energies()], results)):
+                assert len(fieldids) == len(states)
+                # scatter this field's energies into the matrix column using a vectorized binary
+                # search instead of one dict lookup per state
+                energies[roworder[np.searchsorted(sortedids, fieldids)], col] = fieldenergies
+            # store calculated values for this M -- row i of the energy matrix belongs to states[i]
+            for row, state in enumerate(states):
+                self.starkeffect_merge(state, param.dcfields, energies[row])
             # flush HDF5 file after every M
             self.__storage.flush()
 
@@ -293,18 +429,14 @@ class Molecule(object):
 
 
     def starkeffect_states(self):
-        """Get a list of states for which we know the Stark effect."""
-        list = []
-        for groupJ in self.__storage.list_nodes(self.__storage.root, classname='Group'):
-            for groupKa in self.__storage.list_nodes(groupJ, classname='Group'):
-                for groupKc in self.__storage.list_nodes(groupKa, classname='Group'):
-                    for groupM in self.__storage.list_nodes(groupKc, classname='Group'):
-                        for groupIso in self.__storage.list_nodes(groupM, classname='Group'):
-                            statename = (groupJ._v_name + '/' + groupKa._v_name + '/' + groupKc._v_name
-                                         + '/' + groupM._v_name + '/' + groupIso._v_name)
-                            if 'dcfield' == groupIso.dcfield.name and 'dcstarkenergy' == groupIso.dcstarkenergy.name:
-                                list.append(State().fromhdfname(statename))
-        return list
+        """Get a list of states for which we know the Stark effect.
+
+        The states are read from the /stateids index table in a single pass; files from before the
+        index existed are either back-filled (writable files) or walked directly (readonly files).
+        """
+        if 'stateids' not in self.__storage.root and self.__storage.mode == 'r':
+            return self.__walk_states()
+        return [State().fromid(id) for id in self.__stateid_table().col('id')]
 
 
     def states_to_print(self, Jmin, Jmax, statelist=None):
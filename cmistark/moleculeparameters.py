@@ -81,6 +81,8 @@ sub-files that are imported into the local file-/namespace
 
 """
 
+import functools
+
 import numpy as num
 import getopt, sys
 
@@ -90,6 +92,48 @@ import cmistark.starkeffect as starkeffect
 
 from cmistark.molecule import Masses
 
+# frozen element-mass table for formula_mass(), built once at import time from the Masses
+# dictionary; the row of an element in _MASS is given by _ELEM
+_ELEM = {'H': 0, 'D': 1, 'C': 2, 'N': 3, 'O': 4, 'F': 5, 'S': 6, 'Cl': 7, 'Br': 8, 'I': 9}
+_MASS = num.array([Masses['H'], Masses['D'], Masses['C'], Masses['N'], Masses['O'],
+                   Masses['F'], Masses['S'], Masses['Cl'], Masses['BR'], Masses['I']])
+
+
+def formula_mass(**atoms):
+    """Molecular mass of a sum formula, e.g., ``formula_mass(C=8, N=1, H=7)`` for indole.
+
+    The element masses are summed in a single dot product against the frozen mass table instead of
+    one Masses-dictionary lookup per atom type.
+    """
+    counts = num.zeros((_MASS.size,))
+    for element, count in atoms.items():
+        counts[_ELEM[element]] = count
+    return float(_MASS @ counts)
+
+
+@functools.lru_cache(maxsize=None)
+def _converted(converter, values):
+    """Unit-converted, read-only constant array for the given values.
+
+    The molecule functions below convert the same literal rotational constants and dipole moments on
+    every call; memoizing the converted arrays turns the repeated NumPy allocations into a single
+    dict lookup. The arrays are marked read-only as they are shared between calls.
+    """
+    array = converter(num.array(values))
+    array.flags.writeable = False
+    return array
+
+
+def _Hz2J(*values):
+    """Constant array of frequencies (Hz) converted to energies (J); cached, read-only."""
+    return _converted(convert.Hz2J, values)
+
+
+def _D2Cm(*values):
+    """Constant array of dipole moments (D) converted to SI units (Cm); cached, read-only."""
+    return _converted(convert.D2Cm, values)
+
+
 def print_incorrect_warning(name, reason):
     """Print warning for physically incorrect implementations of molecules"""
     print('*** This implementation of the ' + name + ' molecule is not correct, as it does not take the ' + reason + ' into account.\n'
@@ -113,28 +157,28 @@ def asymmetric_top(param):
     param.watson = 'A'
     if param.isomer == 0:
         param.symmetry = 'C2b'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 2000.0e6, 1000.0e6]))
-        param.dipole = convert.D2Cm(num.array([0., 1., 0.]))
+        param.rotcon = _Hz2J(3000.0e6, 2000.0e6, 1000.0e6)
+        param.dipole = _D2Cm(0., 1., 0.)
     elif param.isomer == 1:
         param.symmetry = 'C2c'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 2000.0e6, 1000.0e6]))
-        param.dipole = convert.D2Cm(num.array([0., 0., 1.]))
+        param.rotcon = _Hz2J(3000.0e6, 2000.0e6, 1000.0e6)
+        param.dipole = _D2Cm(0., 0., 1.)
     elif param.isomer == 2:
         param.symmetry = 'N'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 2000.0e6, 1000.0e6]))
-        param.dipole = convert.D2Cm(num.array([0., 1., 1.]))
+        param.rotcon = _Hz2J(3000.0e6, 2000.0e6, 1000.0e6)
+        param.dipole = _D2Cm(0., 1., 1.)
     elif param.isomer == 3:
         param.symmetry = 'N'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 2000.0e6, 1000.0e6]))
-        param.dipole = convert.D2Cm(num.array([1., 0., 1.]))
+        param.rotcon = _Hz2J(3000.0e6, 2000.0e6, 1000.0e6)
+        param.dipole = _D2Cm(1., 0., 1.)
     elif param.isomer == 4:
         param.symmetry = 'N'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 2000.0e6, 1000.0e6]))
-        param.dipole = convert.D2Cm(num.array([1., 1., 0.]))
+        param.rotcon = _Hz2J(3000.0e6, 2000.0e6, 1000.0e6)
+        param.dipole = _D2Cm(1., 1., 0.)
     elif param.isomer == 5:
         param.symmetry = 'N'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 2000.0e6, 1000.0e6]))
-        param.dipole = convert.D2Cm(num.array([1., 1., 1.]))
+        param.rotcon = _Hz2J(3000.0e6, 2000.0e6, 1000.0e6)
+        param.dipole = _D2Cm(1., 1., 1.)
 
 
 
@@ -154,23 +198,23 @@ def three_aminophenol(param):
     param.watson = 'A'
     param.symmetry = 'N'
     if param.isomer == 0: # cis, Filsinger et al. PCCP ...
-        param.rotcon = convert.Hz2J(num.array([3734.93e6, 1823.2095e6, 1226.493e6]))
-        param.dipole = convert.D2Cm(num.array([1.7718, 1.517, 0.]))
+        param.rotcon = _Hz2J(3734.93e6, 1823.2095e6, 1226.493e6)
+        param.dipole = _D2Cm(1.7718, 1.517, 0.)
     elif param.isomer == 1:
-        param.rotcon = convert.Hz2J(num.array([3730.1676e6, 1828.25774e6, 1228.1948e6]))
-        param.dipole = convert.D2Cm(num.array([0.5563, 0.5375, 0.]))
+        param.rotcon = _Hz2J(3730.1676e6, 1828.25774e6, 1228.1948e6)
+        param.dipole = _D2Cm(0.5563, 0.5375, 0.)
     elif param.isomer == 2:
-        param.rotcon = convert.Hz2J(num.array([3748.0923e6, 1824.5812e6, 1228.7585e6]))
-        param.dipole = convert.D2Cm(num.array([1.793, 1.4396, 0.]))
+        param.rotcon = _Hz2J(3748.0923e6, 1824.5812e6, 1228.7585e6)
+        param.dipole = _D2Cm(1.793, 1.4396, 0.)
     elif param.isomer == 3:
-        param.rotcon = convert.Hz2J(num.array([3736.8454e6, 1831.7399e6, 1230.7259e6]))
-        param.dipole = convert.D2Cm(num.array([0.3953, 0.8203, 0.]))
+        param.rotcon = _Hz2J(3736.8454e6, 1831.7399e6, 1230.7259e6)
+        param.dipole = _D2Cm(0.3953, 0.8203, 0.)
     elif param.isomer == 4:
-        param.rotcon = convert.Hz2J(num.array([3755.0444e6, 1828.9366e6, 1231.0926e6]))
-        param.dipole = convert.D2Cm(num.array([1.8575, 1.6484, 0.]))
+        param.rotcon = _Hz2J(3755.0444e6, 1828.9366e6, 1231.0926e6)
+        param.dipole = _D2Cm(1.8575, 1.6484, 0.)
     elif param.isomer == 5:
-        param.rotcon = convert.Hz2J(num.array([3752.3419e6, 1833.1737e6, 1232.6659e6]))
-        param.dipole = convert.D2Cm(num.array([0.5705, 0.4771, 0.]))
+        param.rotcon = _Hz2J(3752.3419e6, 1833.1737e6, 1232.6659e6)
+        param.dipole = _D2Cm(0.5705, 0.4771, 0.)
 
 
 def oblate_symmetric_top(param):
@@ -182,39 +226,39 @@ def oblate_symmetric_top(param):
     1. rotor type is set to 'A' - asymmetric top, and symmetry is set to 'C2c' - only u_c != 0
     """
     param.name = "oblate_symmetric_top"
-    param.mass = 6 * Masses['C'] + 6 * Masses['H']
+    param.mass = formula_mass(C=6, H=6)
     if 0 == param.isomer:
         param.type = 'S'
         param.symmetry = 'o'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 1000.0e6]))
+        param.rotcon = _Hz2J(3000.0e6, 1000.0e6)
         param.quartic  = num.array([convert.Hz2J(0.0), convert.Hz2J(0.0), convert.invcm2J(0.0)])
-        param.dipole = convert.D2Cm(num.array([1.]))
+        param.dipole = _D2Cm(1.)
     elif 1 == param.isomer:
         param.type = 'A'
         param.watson = 'A'
         param.symmetry = 'C2c'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 3000.0e6, 1000.0e6]))
+        param.rotcon = _Hz2J(3000.0e6, 3000.0e6, 1000.0e6)
         param.quartic  = num.array([0., 0., 0., 0., 0.])
-        param.dipole = convert.D2Cm(num.array([0., 0., 1.]))
+        param.dipole = _D2Cm(0., 0., 1.)
 
 
 def prolate_symmetric_top(param):
     """Molecular parameters for an artificial prolate top"""
     param.name = "prolate_symmetric_top"
-    param.mass = 6 * Masses['C'] + 6 * Masses['H']
+    param.mass = formula_mass(C=6, H=6)
     if 0 == param.isomer:
         param.type = 'S'
         param.symmetry = 'p'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 1000.0e6]))
+        param.rotcon = _Hz2J(3000.0e6, 1000.0e6)
         param.quartic  = num.array([convert.Hz2J(0.0), convert.Hz2J(0.0), convert.invcm2J(0.0)])
-        param.dipole = convert.D2Cm(num.array([1.]))
+        param.dipole = _D2Cm(1.)
     elif 1 == param.isomer:
         param.type = 'A'
         param.watson = 'A'
         param.symmetry = 'C2a'
-        param.rotcon = convert.Hz2J(num.array([3000.0e6, 1000.0e6, 1000.0e6]))
+        param.rotcon = _Hz2J(3000.0e6, 1000.0e6, 1000.0e6)
         param.quartic  = num.array([0., 0., 0., 0., 0.])
-        param.dipole = convert.D2Cm(num.array([1., 0., 0.]))
+        param.dipole = _D2Cm(1., 0., 0.)
 
 
 def adenine(param):
@@ -226,15 +270,15 @@ def adenine(param):
 
     """
     param.name = "adenine"
-    param.mass = 5 * Masses['C'] + 5 * Masses['H'] + 5 * Masses['N']
+    param.mass = formula_mass(C=5, H=5, N=5)
     param.watson = 'A'
     param.symmetry = 'N'
     if param.isomer == 0: # tautomer 9H
-        param.rotcon = convert.Hz2J(num.array([2371.873e6, 1573.3565e6, 946.2576e6]))
-        param.dipole = convert.D2Cm(num.array([1.86, -1.39, -0.03]))
+        param.rotcon = _Hz2J(2371.873e6, 1573.3565e6, 946.2576e6)
+        param.dipole = _D2Cm(1.86, -1.39, -0.03)
     elif param.isomer == 1: # tautomer 7H
-        param.rotcon = convert.Hz2J(num.array([2381.1e6, 1531.7e6, 933.0e6]))
-        param.dipole = convert.D2Cm(num.array([-0.27, -6.79, 0.67]))
+        param.rotcon = _Hz2J(2381.1e6, 1531.7e6, 933.0e6)
+        param.dipole = _D2Cm(-0.27, -6.79, 0.67)
 
 
 def AcPheCysNH2(param):
@@ -243,16 +287,16 @@ def AcPheCysNH2(param):
     .. todo:: Document (reference) the source of the parameters
     """
     param.name = "apcn"
-    param.mass = 14 * Masses['C'] + 3 * Masses['O'] + 3 * Masses['N'] + 1 * Masses['S'] + 19 * Masses['H']
+    param.mass = formula_mass(C=14, O=3, N=3, S=1, H=19)
     param.type = 'A'
     param.watson = 'A'
     param.symmetry = 'N'
     if param.isomer == 0:
-        param.rotcon = convert.Hz2J(num.array([340.181593e6, 203.443113e6, 159.877010e6]))
-        param.dipole = convert.D2Cm(num.array([0.768, 2.406, 1.975]))
+        param.rotcon = _Hz2J(340.181593e6, 203.443113e6, 159.877010e6)
+        param.dipole = _D2Cm(0.768, 2.406, 1.975)
     elif param.isomer == 1:
-        param.rotcon = convert.Hz2J(num.array([345.067516e6, 215.965933e6, 175.850323e6]))
-        param.dipole = convert.D2Cm(num.array([6.789, -2.701, 3.406]))
+        param.rotcon = _Hz2J(345.067516e6, 215.965933e6, 175.850323e6)
+        param.dipole = _D2Cm(6.789, -2.701, 3.406)
 
 
 def five_fluoroindole(param):
@@ -262,11 +306,11 @@ def five_fluoroindole(param):
     Dipole moments from MP2 calculations (Daniel Horke, Feb 2015, Gamess2013, 6-311G++(d,p), MP2)
     """
     param.name = "five_fluoroindole"
-    param.mass = 8 * Masses['C'] + 6 * Masses['H'] + 1 * Masses['N'] + 1 * Masses['F']
+    param.mass = formula_mass(C=8, H=6, N=1, F=1)
     param.watson = 'A'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([3519.57e6, 1019.79e6, 790.87e6]))
-    param.dipole = convert.D2Cm(num.array([-3.40, -2.52, 0.0]))
+    param.rotcon = _Hz2J(3519.57e6, 1019.79e6, 790.87e6)
+    param.dipole = _D2Cm(-3.40, -2.52, 0.0)
 
 
 def indole(param):
@@ -278,16 +322,16 @@ def indole(param):
     1.  experimental inertial constants from [Caminati1990]_ and dipole moment from [Kang2005]_ for dipole moment.
     """
     param.name = "indole"
-    param.mass = 8 * Masses['C'] + Masses['N'] + 7 * Masses['H']
+    param.mass = formula_mass(C=8, N=1, H=7)
     param.watson = 'A'
     param.symmetry = 'N'
     if 0 == param.isomer:
-        param.rotcon = convert.Hz2J(num.array([3877.9e6, 1636.1e6, 1150.9e6]))
-        param.dipole = convert.D2Cm(num.array([1.376, 1.400, 0.]))
+        param.rotcon = _Hz2J(3877.9e6, 1636.1e6, 1150.9e6)
+        param.dipole = _D2Cm(1.376, 1.400, 0.)
     elif 1 == param.isomer:
-        param.rotcon = convert.Hz2J(num.array([3877.826e6, 1636.047e6, 1150.8997e6]))
-        param.quartic = convert.Hz2J(num.array([0.0352e3, 0.042e3, 0.16e3, 0.1005e3, 0.128e3]))
-        param.dipole = convert.D2Cm(num.array([1.376, 1.400, 0.]))
+        param.rotcon = _Hz2J(3877.826e6, 1636.047e6, 1150.8997e6)
+        param.quartic = _Hz2J(0.0352e3, 0.042e3, 0.16e3, 0.1005e3, 0.128e3)
+        param.dipole = _D2Cm(1.376, 1.400, 0.)
 
 
 def indole_water1(param):
@@ -299,17 +343,17 @@ def indole_water1(param):
     1.  experimental inertial parameters from [Blanco2003]_ and experimental dipole moment from [Kang2005]_
     """
     param.name = "indole-water"
-    param.mass = 8 * Masses['C'] + Masses['N'] + Masses['O'] + 9 * Masses['H']
+    param.mass = formula_mass(C=8, N=1, O=1, H=9)
     param.watson = 'A'
     param.symmetry = 'N'
     if 0 == param.isomer:
-        param.rotcon = convert.Hz2J(num.array([2062.5e6, 945.1e6, 649.3e6]))
-        param.quartic = convert.Hz2J(num.array([0.0011e6, -0.006e6, 0.014e6, 0.0005e6, 0.001e6]))
-        param.dipole = convert.D2Cm(num.array([4.2, 1.2, 0.]))
+        param.rotcon = _Hz2J(2062.5e6, 945.1e6, 649.3e6)
+        param.quartic = _Hz2J(0.0011e6, -0.006e6, 0.014e6, 0.0005e6, 0.001e6)
+        param.dipole = _D2Cm(4.2, 1.2, 0.)
     elif 1 == param.isomer:
-        param.rotcon = convert.Hz2J(num.array([2064.3954e6, 945.09179e6, 649.21543e6]))
-        param.quartic = convert.Hz2J(num.array([1.0708e3, -5.736e3, 14.13e3, 0.4551e3, 1.341e3]))
-        param.dipole = convert.D2Cm(num.array([4.2, 1.2, 0.]))
+        param.rotcon = _Hz2J(2064.3954e6, 945.09179e6, 649.21543e6)
+        param.quartic = _Hz2J(1.0708e3, -5.736e3, 14.13e3, 0.4551e3, 1.341e3)
+        param.dipole = _D2Cm(4.2, 1.2, 0.)
 
 
 def indole_water2(param):
@@ -322,12 +366,12 @@ def indole_water2(param):
     .. todo:: Everybody: See the math-usage and implement it for all sub- and super-scripts (if any)
     """
     param.name = "indole-water2"
-    param.mass = 8 * Masses['C'] + Masses['N'] + 2 * Masses['O'] + 11 * Masses['H']
+    param.mass = formula_mass(C=8, N=1, O=2, H=11)
     param.watson = 'A'
     param.symmetry = 'N'
     param.isomer = 0
-    param.rotcon = convert.Hz2J(num.array([1323.5e6, 814.34e6, 587.86e6]))
-    param.dipole = convert.D2Cm(num.array([1.46, -1.76, 1.31]))
+    param.rotcon = _Hz2J(1323.5e6, 814.34e6, 587.86e6)
+    param.dipole = _D2Cm(1.46, -1.76, 1.31)
 
 
 def water(param):
@@ -350,22 +394,22 @@ def water(param):
     param.name = "water"
     param.watson = 'A'
     if param.isomer == 0:
-        param.mass = Masses['O'] + 2 * Masses['H']
+        param.mass = formula_mass(O=1, H=2)
         param.symmetry = 'C2b'
-        param.rotcon = convert.Hz2J(num.array([835840.288e6, 435351.717e6, 278138.700e6]))
-        param.quartic = convert.Hz2J(num.array([37.59422e6, -172.9128e6, 973.29052e6, 15.210402e6, 41.0502e6]))
-        param.dipole = convert.D2Cm(num.array([0., -1.857, 0.]))
+        param.rotcon = _Hz2J(835840.288e6, 435351.717e6, 278138.700e6)
+        param.quartic = _Hz2J(37.59422e6, -172.9128e6, 973.29052e6, 15.210402e6, 41.0502e6)
+        param.dipole = _D2Cm(0., -1.857, 0.)
     elif param.isomer == 1:
-        param.mass = Masses['O'] + 2 * Masses['D']
+        param.mass = formula_mass(O=1, D=2)
         param.symmetry = 'C2b'
-        param.rotcon = convert.Hz2J(num.array([462278.854e6, 218038.233e6, 145258.022e6]))
-        param.dipole = convert.D2Cm(num.array([0., -1.8558, 0.]))
+        param.rotcon = _Hz2J(462278.854e6, 218038.233e6, 145258.022e6)
+        param.dipole = _D2Cm(0., -1.8558, 0.)
     elif param.isomer == 2:
-        param.mass = Masses['O'] + Masses['H'] + Masses['D']
+        param.mass = formula_mass(O=1, H=1, D=1)
         param.symmetry = 'N'
-        param.rotcon = convert.Hz2J(num.array([701931.50e6, 272912.60e6, 192055.25e6]))
-        param.quartic = convert.Hz2J(num.array([10.8375e6, 34.208e6, 377.078e6, 3.6471e6, 63.087e6]))
-        param.dipole = convert.D2Cm(num.array([-0.6591, -1.7304, 0.]))
+        param.rotcon = _Hz2J(701931.50e6, 272912.60e6, 192055.25e6)
+        param.quartic = _Hz2J(10.8375e6, 34.208e6, 377.078e6, 3.6471e6, 63.087e6)
+        param.dipole = _D2Cm(-0.6591, -1.7304, 0.)
 
 
 def water_dimer(param):
@@ -378,11 +422,11 @@ def water_dimer(param):
     print_incorrect_warning('water-dimer', 'floppiness')
     param.name = "water2"
     param.symmetry = 'C2a'
-    param.mass = 2 * Masses['O'] + 4* Masses['H']
+    param.mass = formula_mass(O=2, H=4)
     param.watson = 'S'
-    param.rotcon = convert.Hz2J(num.array([190327.0e+6, 6162.762e+06, 6133.741e+06]))
-    param.dipole = convert.D2Cm(num.array([2.63, 0.0, 0.0]))
-    param.quartic = convert.Hz2J(num.array([44e+3, 4.01e+6, 0., 0., 0.]))#\Delta_{J}, \Delta_{JK}, \Delta_{K}, d_{J}, d_{K}
+    param.rotcon = _Hz2J(190327.0e+6, 6162.762e+06, 6133.741e+06)
+    param.dipole = _D2Cm(2.63, 0.0, 0.0)
+    param.quartic = _Hz2J(44e+3, 4.01e+6, 0., 0., 0.)#\Delta_{J}, \Delta_{JK}, \Delta_{K}, d_{J}, d_{K}
 
 
 def water_trimer(param):
@@ -395,9 +439,9 @@ def water_trimer(param):
     """
     param.name = "water_trimer"
     param.symmetry = 'C2a'
-    param.mass = 3 * Masses['O'] + 6* Masses['H']
-    param.rotcon = convert.Hz2J(num.array([6646.91e+6, 6646.91e+06, 0e+06]))
-    param.dipole = convert.D2Cm(num.array([0.0, 0.0, 0.0]))
+    param.mass = formula_mass(O=3, H=6)
+    param.rotcon = _Hz2J(6646.91e+6, 6646.91e+06, 0e+06)
+    param.dipole = _D2Cm(0.0, 0.0, 0.0)
 
 def water_tetramer(param):
     """Molecular parameters for water tetramer (cyclic)`
@@ -409,9 +453,9 @@ def water_tetramer(param):
    """
     param.name = "water_tetramer"
     param.symmetry = 'N'
-    param.mass = 4 * Masses['O'] + 8* Masses['H']
-    param.rotcon = convert.Hz2J(num.array([3149e+6, 3149e+06, 1622e+06]))
-    param.dipole = convert.D2Cm(num.array([0.0, 0.0, 0.0]))
+    param.mass = formula_mass(O=4, H=8)
+    param.rotcon = _Hz2J(3149e+6, 3149e+06, 1622e+06)
+    param.dipole = _D2Cm(0.0, 0.0, 0.0)
 
 def water_pentamer(param):
     """Molecular parameters for water pentamer (cyclic)`
@@ -422,9 +466,9 @@ def water_pentamer(param):
     """
     param.name = "water_pentamer"
     param.symmetry = 'C2a'
-    param.mass = 5 * Masses['O'] + 10* Masses['H']
-    param.rotcon = convert.Hz2J(num.array([1859e+6, 1818e+06, 940e+06]))
-    param.dipole = convert.D2Cm(num.array([0.927, 0.0, 0.0]))
+    param.mass = formula_mass(O=5, H=10)
+    param.rotcon = _Hz2J(1859e+6, 1818e+06, 940e+06)
+    param.dipole = _D2Cm(0.927, 0.0, 0.0)
 
 def water_hexamer(param):
     """Molecular parameters for water hexamer1 cage structure`
@@ -444,16 +488,16 @@ def water_hexamer(param):
     param.name = "water_hexamer"
     param.symmetry = 's'
     param.watson = 'S'
-    param.mass = 6 * Masses['O'] + 12* Masses['H']
+    param.mass = formula_mass(O=6, H=12)
     if param.isomer == 0:
-        param.rotcon = convert.Hz2J(num.array([2163.61e+6, 1131.2e+06, 1068.8e+06]))
-        param.dipole = convert.D2Cm(num.array([1.63, 0.32, 1.13]))
+        param.rotcon = _Hz2J(2163.61e+6, 1131.2e+06, 1068.8e+06)
+        param.dipole = _D2Cm(1.63, 0.32, 1.13)
     elif param.isomer == 1:
-        param.rotcon = convert.Hz2J(num.array([1658.224e+6, 1362.000e+06, 1313.124e+06]))
-        param.dipole = convert.D2Cm(num.array([2.41, 0.88, 0.42]))
+        param.rotcon = _Hz2J(1658.224e+6, 1362.000e+06, 1313.124e+06)
+        param.dipole = _D2Cm(2.41, 0.88, 0.42)
     elif param.isomer ==2:
-        param.rotcon = convert.Hz2J(num.array([1879.4748e+6, 1063.9814e+06, 775.0619e+06]))
-        param.dipole = convert.D2Cm(num.array([0.17, 2.46, 0.16]))
+        param.rotcon = _Hz2J(1879.4748e+6, 1063.9814e+06, 775.0619e+06)
+        param.dipole = _D2Cm(0.17, 2.46, 0.16)
 
 def water_heptamer(param):
     """Molecular parameters for water heptamer1 `
@@ -470,18 +514,18 @@ def water_heptamer(param):
     * Symmetry C1 from [Kim:JCP110:9128] https://pdfs.semanticscholar.org/2dbf/30f606a224ca7f05885ac28d1ab4d930bc36.pdf
     """
     param.name = "water_heptamer"
-    param.mass = 7 * Masses['O'] + 14* Masses['H']
+    param.mass = formula_mass(O=7, H=14)
     param.symmetry = 'N'
     if param.isomer == 0:
         param.watson = 'A'
-        param.rotcon = convert.Hz2J(num.array([1304.43555e+6, 937.88441e+06, 919.52364e+06]))
-        param.dipole = convert.D2Cm(num.array([1.0, 1.0, 0.0]))
-        param.quartic = convert.Hz2J(num.array([0.4567e+3, -0.342e+3, 0.842e+3, 0.0377e+3, 0.63e+3]))#\Delta_{J}, \Delta_{JK}, \Delta_{K}, d_{J}, d_{K}
+        param.rotcon = _Hz2J(1304.43555e+6, 937.88441e+06, 919.52364e+06)
+        param.dipole = _D2Cm(1.0, 1.0, 0.0)
+        param.quartic = _Hz2J(0.4567e+3, -0.342e+3, 0.842e+3, 0.0377e+3, 0.63e+3)#\Delta_{J}, \Delta_{JK}, \Delta_{K}, d_{J}, d_{K}
     elif param.isomer == 1:
         param.watson = 'S'
-        param.rotcon = convert.Hz2J(num.array([1345.15942e+6, 976.8789e+06, 854.47389e+06]))
-        param.dipole = convert.D2Cm(num.array([1.0, 0.0, 1.0]))
-#        param.quartic = convert.Hz2J(num.array([0.0439e+3, 0.0, 0.0, 0.0497, 0.0]))#\Delta_{J}, \Delta_{JK}, \Delta_{K}, d_{J}, d_{K}
+        param.rotcon = _Hz2J(1345.15942e+6, 976.8789e+06, 854.47389e+06)
+        param.dipole = _D2Cm(1.0, 0.0, 1.0)
+#        param.quartic = _Hz2J(0.0439e+3, 0.0, 0.0, 0.0497, 0.0)#\Delta_{J}, \Delta_{JK}, \Delta_{K}, d_{J}, d_{K}
 
 def water_octamer(param):
     """Molecular parameters for octamer`
@@ -490,11 +534,11 @@ def water_octamer(param):
     * rotational constants A,B,C taken from  http://science.sciencemag.org/content/276/5319/1678
     """
     param.name = "water_octamer"
-    param.mass = 8 * Masses['O'] + 16* Masses['H']
+    param.mass = formula_mass(O=8, H=16)
     param.symmetry = 'N'
     param.watson = 'S'
-    param.rotcon = convert.Hz2J(num.array([0.92437e+6, 0.89338e+06, 0.89338e+06]))
-    param.dipole = convert.D2Cm(num.array([0.0, 0.0, 0.0]))
+    param.rotcon = _Hz2J(0.92437e+6, 0.89338e+06, 0.89338e+06)
+    param.dipole = _D2Cm(0.0, 0.0, 0.0)
 
 def water_nonamer(param):
     """Molecular parameters for nonamer`
@@ -503,9 +547,9 @@ def water_nonamer(param):
     * rotational constants A,B,C taken from http://science.sciencemag.org/content/sci/336/6083/897.full.pdf
     """
     param.name = "water_nonamer"
-    param.mass = 9 * Masses['O'] + 18* Masses['H']
-    param.rotcon = convert.Hz2J(num.array([774.7442e+06, 633.5403e+06, 570.6460e+06]))
-    param.dipole = convert.D2Cm(num.array([0.0, 0.0, 0.0]))
+    param.mass = formula_mass(O=9, H=18)
+    param.rotcon = _Hz2J(774.7442e+06, 633.5403e+06, 570.6460e+06)
+    param.dipole = _D2Cm(0.0, 0.0, 0.0)
 
 def water_decamer(param):
     """Molecular parameters for decamer`
@@ -514,9 +558,9 @@ def water_decamer(param):
     * rotational constants A,B,C taken from https://aip.scitation.org/doi/pdf/10.1063/1.481613?class=pdf
     """
     param.name = "water_decamer"
-    param.mass = 10 * Masses['O'] + 20* Masses['H']
-    param.rotcon = convert.Hz2J(num.array([591e+06, 569e+06, 509e+06]))
-    param.dipole = convert.D2Cm(num.array([2.7, 0.0, 0.0]))
+    param.mass = formula_mass(O=10, H=20)
+    param.rotcon = _Hz2J(591e+06, 569e+06, 509e+06)
+    param.dipole = _D2Cm(2.7, 0.0, 0.0)
 
 def OCS(param):
     """Molecular parameters for OCS
@@ -535,25 +579,25 @@ def OCS(param):
 
     """
     param.name = "OCS"
-    param.mass = Masses['O'] + Masses['C'] + Masses['S']
+    param.mass = formula_mass(O=1, C=1, S=1)
     if 0 == param.isomer:
         param.type = 'L'
         param.symmetry = 'N'
-        param.rotcon = convert.Hz2J(num.array([6.081492475e9]))
-        param.dipole = convert.D2Cm(num.array([0.71519]))
-        param.quartic  = convert.Hz2J(num.array([1.301777e3]))
+        param.rotcon = _Hz2J(6.081492475e9)
+        param.dipole = _D2Cm(0.71519)
+        param.quartic  = _Hz2J(1.301777e3)
     elif 1 == param.isomer:
         param.type = 'S'
         param.symmetry = 'p'
-        param.rotcon = convert.Hz2J(num.array([1e15, 6.081492475e9]))
-        param.dipole = convert.D2Cm(num.array([0.71519]))
-        param.quartic  = convert.Hz2J(num.array([1.301777e3, 0., 0.]))
+        param.rotcon = _Hz2J(1e15, 6.081492475e9)
+        param.dipole = _D2Cm(0.71519)
+        param.quartic  = _Hz2J(1.301777e3, 0., 0.)
     elif 2 == param.isomer:
         param.type = 'A'
         param.symmetry = 'C2a'
-        param.rotcon = convert.Hz2J(num.array([1e15, 6.081492475e9, 6.081492475e9]))
-        param.dipole = convert.D2Cm(num.array([0.71519, 0., 0.]))
-        param.quartic  = convert.Hz2J(num.array([1.301777e3, 0., 0., 0., 0.]))
+        param.rotcon = _Hz2J(1e15, 6.081492475e9, 6.081492475e9)
+        param.dipole = _D2Cm(0.71519, 0., 0.)
+        param.quartic  = _Hz2J(1.301777e3, 0., 0., 0., 0.)
 
 
 def iodomethane(param):
@@ -574,20 +618,25 @@ def iodomethane(param):
 
     """
     param.name = "iodomethane"
-    param.mass = 3*Masses['H'] + Masses['C'] + Masses['I']
+    param.mass = formula_mass(H=3, C=1, I=1)
     if 0 == param.isomer:
         param.type = 'S'
         param.symmetry = 'p'
-        param.rotcon = num.array([convert.invcm2J(5.1742629), convert.Hz2J(7501.2757456e6)])
-        param.quartic  = num.array([convert.Hz2J(6.307583e3), convert.Hz2J(98.76798e3), convert.invcm2J(87.857e-6)])
-        param.dipole = convert.D2Cm(num.array([1.6406]))
+        # convert all rotational and distortion constants (Hz) to Joule in one vectorized call
+        constants = convert.Hz2J(num.array([convert.invcm2Hz(5.1742629), 7501.2757456e6,
+                                            6.307583e3, 98.76798e3, convert.invcm2Hz(87.857e-6)]))
+        param.rotcon = constants[:2]
+        param.quartic = constants[2:]
+        param.dipole = _D2Cm(1.6406)
     elif 1 == param.isomer:
         param.type = 'A'
         param.watson = 'A'
         param.symmetry = 'C2a'
-        param.rotcon = num.array([convert.invcm2J(5.1742629), convert.Hz2J(7501.2757456e6), convert.Hz2J(7501.2757456e6)])
-        param.quartic  = num.array([convert.Hz2J(6.307583e3), convert.Hz2J(98.76798e3), convert.invcm2J(87.857e-6), 0., 0.])
-        param.dipole = convert.D2Cm(num.array([1.6406, 0., 0.]))
+        constants = convert.Hz2J(num.array([convert.invcm2Hz(5.1742629), 7501.2757456e6, 7501.2757456e6,
+                                            6.307583e3, 98.76798e3, convert.invcm2Hz(87.857e-6), 0., 0.]))
+        param.rotcon = constants[:3]
+        param.quartic = constants[3:]
+        param.dipole = _D2Cm(1.6406, 0., 0.)
 
 
 def difluoro_iodobenzene(param):
@@ -597,9 +646,9 @@ def difluoro_iodobenzene(param):
     param.type = 'A'
     param.watson = 'A'
     param.symmetry = 'C2a'
-    param.rotcon = convert.Hz2J(num.array([1740e6, 713e6, 506e6]))
-    param.quartic = convert.Hz2J(num.array([0., 0., 0., 0., 0.]))
-    param.dipole = convert.D2Cm(num.array([2.25, 0., 0.]))
+    param.rotcon = _Hz2J(1740e6, 713e6, 506e6)
+    param.quartic = _Hz2J(0., 0., 0., 0., 0.)
+    param.dipole = _D2Cm(2.25, 0., 0.)
 
 
 def diiodoethane(param):
@@ -628,12 +677,12 @@ def diiodoethane(param):
 #     param.watson = 'A'
 #     if param.isomer == 0: # anti
 #         param.symmetry = 'N'
-#         param.rotcon = convert.Hz2J(num.array([2.79227492e10, 3.09470163e8, 3.07270856e8]))
-#         param.dipole = convert.D2Cm(num.array([0., 0., 0.]))
+#         param.rotcon = _Hz2J(2.79227492e10, 3.09470163e8, 3.07270856e8)
+#         param.dipole = _D2Cm(0., 0., 0.)
 #     elif param.isomer == 1: # gauge
 #         param.symmetry = 'C2b'
-#         param.rotcon = convert.Hz2J(num.array([6.18776669e9, 4.92744613e8, 4.63936461e8]))
-#         param.dipole = convert.D2Cm(num.array([0., 2.249726, 0.]))
+#         param.rotcon = _Hz2J(6.18776669e9, 4.92744613e8, 4.63936461e8)
+#         param.dipole = _D2Cm(0., 2.249726, 0.)
 
 
 def two_aminobenzonitrile(param):
@@ -643,9 +692,9 @@ def two_aminobenzonitrile(param):
     param.type = 'A'
     param.watson = 'A'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([3.0090e9, 1.5090e9, 1.0052e9]))
-    param.quartic = convert.Hz2J(num.array([0.0, 0.0, 0.0, 0.0, 0.0]))
-    param.dipole = convert.D2Cm(num.array([3.6, 1.9, 0.]))
+    param.rotcon = _Hz2J(3.0090e9, 1.5090e9, 1.0052e9)
+    param.quartic = _Hz2J(0.0, 0.0, 0.0, 0.0, 0.0)
+    param.dipole = _D2Cm(3.6, 1.9, 0.)
 
 
 def three_aminobenzonitrile(param):
@@ -655,9 +704,9 @@ def three_aminobenzonitrile(param):
     param.type = 'A'
     param.watson = 'A'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([3.3727e9, 1.2099e9, 0.8908e9]))
-    param.quartic = convert.Hz2J(num.array([0.0, 0.0, 0.0, 0.0, 0.0]))
-    param.dipole = convert.D2Cm(num.array([4.8, 1.2, 0.]))
+    param.rotcon = _Hz2J(3.3727e9, 1.2099e9, 0.8908e9)
+    param.quartic = _Hz2J(0.0, 0.0, 0.0, 0.0, 0.0)
+    param.dipole = _D2Cm(4.8, 1.2, 0.)
 
 
 def four_aminobenzonitrile(param):
@@ -667,22 +716,22 @@ def four_aminobenzonitrile(param):
     param.type = 'A'
     param.watson = 'A'
     param.symmetry = 'C2a'
-    param.rotcon = convert.Hz2J(num.array([5.5793e9, 0.99026e9, 0.84139e9]))
-    param.quartic = convert.Hz2J(num.array([0.0, 0.0, 0.0, 0.0, 0.0]))
-    param.dipole = convert.D2Cm(num.array([6.41, 0., 0.]))
+    param.rotcon = _Hz2J(5.5793e9, 0.99026e9, 0.84139e9)
+    param.quartic = _Hz2J(0.0, 0.0, 0.0, 0.0, 0.0)
+    param.dipole = _D2Cm(6.41, 0., 0.)
 
 
 def benzonitrile(param):
     """ See [Wohlfart2008]_
     """
     param.name = "benzonitrile"
-    param.mass = 7 * Masses['C'] + Masses['N'] + 5 * Masses['H']
+    param.mass = formula_mass(C=7, N=1, H=5)
     param.type = 'A'
     param.watson = 'A'
     param.symmetry = 'C2a'
-    param.rotcon = convert.Hz2J(num.array([5655.2654e6, 1546.875864e6, 1214.40399e6]))
-    param.quartic = convert.Hz2J(num.array([45.6, 938.1, 500.0, 10.95, 628.0]))
-    param.dipole = convert.D2Cm(num.array([4.5152, 0., 0.]))
+    param.rotcon = _Hz2J(5655.2654e6, 1546.875864e6, 1214.40399e6)
+    param.quartic = _Hz2J(45.6, 938.1, 500.0, 10.95, 628.0)
+    param.dipole = _D2Cm(4.5152, 0., 0.)
 
 
 def glycine(param):
@@ -704,23 +753,23 @@ def glycine(param):
 #     param.watson = 'A'
 #     param.symmetry = 'N'
 #     if param.isomer == 0: # cis, Filsinger et al. PCCP ...
-#         param.rotcon = convert.Hz2J(num.array([10.3415e9, 3.87618e9, 2.91235e9]))
-#         param.dipole = convert.D2Cm(num.array([0.911, 0.697, 0.]))
+#         param.rotcon = _Hz2J(10.3415e9, 3.87618e9, 2.91235e9)
+#         param.dipole = _D2Cm(0.911, 0.697, 0.)
 #     elif param.isomer == 1:
-#         param.rotcon = convert.Hz2J(num.array([10.1301e9, 4.07151e9, 3.00748e9]))
-#         param.dipole = convert.D2Cm(num.array([5.372, 0.93, 0.]))
+#         param.rotcon = _Hz2J(10.1301e9, 4.07151e9, 3.00748e9)
+#         param.dipole = _D2Cm(5.372, 0.93, 0.)
 #     elif param.isomer == 2:
-#         param.rotcon = convert.Hz2J(num.array([9.71997e9, 3.97849e9, 2.98658e9]))
-#         param.dipole = convert.D2Cm(num.array([-0.1559, 1.6907, -0.0773]))
+#         param.rotcon = _Hz2J(9.71997e9, 3.97849e9, 2.98658e9)
+#         param.dipole = _D2Cm(-0.1559, 1.6907, -0.0773)
 #     elif param.isomer == 3:
-#         param.rotcon = convert.Hz2J(num.array([10.2564941e9, 3.9707803e9, 2.9620284e9]))
-#         param.dipole = convert.D2Cm(num.array([-0.0058, -1.5519, 1.4356]))
+#         param.rotcon = _Hz2J(10.2564941e9, 3.9707803e9, 2.9620284e9)
+#         param.dipole = _D2Cm(-0.0058, -1.5519, 1.4356)
 #     elif param.isomer == 4:
-#         param.rotcon = convert.Hz2J(num.array([0., 0., 0.]))
-#         param.dipole = convert.D2Cm(num.array([0., 0., 0.]))
+#         param.rotcon = _Hz2J(0., 0., 0.)
+#         param.dipole = _D2Cm(0., 0., 0.)
 #     elif param.isomer == 5:
-#         param.rotcon = convert.Hz2J(num.array([0., 0., 0.]))
-#         param.dipole = convert.D2Cm(num.array([0., 0., 0.]))
+#         param.rotcon = _Hz2J(0., 0., 0.)
+#         param.dipole = _D2Cm(0., 0., 0.)
 
 
 def iodobenzene(param):
@@ -736,10 +785,10 @@ def iodobenzene(param):
     param.name = "iodobenzene"
     param.watson = 'A'
     param.symmetry = 'C2a'
-    param.rotcon = convert.Hz2J(num.array([5669.126e6, 750.414323e6, 662.636162e6]))
-    param.quartic = convert.Hz2J(num.array([19.5479, 164.648, 891, 2.53098, 15554]))
-    # param.sextic =  convert.Hz2J(num.array([0.0609, -0.377])) # ignored sextic constants!
-    param.dipole = convert.D2Cm(num.array([1.6250, 0., 0.]))
+    param.rotcon = _Hz2J(5669.126e6, 750.414323e6, 662.636162e6)
+    param.quartic = _Hz2J(19.5479, 164.648, 891, 2.53098, 15554)
+    # param.sextic =  _Hz2J(0.0609, -0.377) # ignored sextic constants!
+    param.dipole = _D2Cm(1.6250, 0., 0.)
 
 
 def phenylpyrrole(param):
@@ -748,8 +797,8 @@ def phenylpyrrole(param):
     param.name = "phenylpyrrole"
     param.watson = 'A'
     param.symmetry = 'C2a'
-    param.rotcon = convert.Hz2J(num.array([3508.34e6, 703.50e6, 604.84e6]))
-    param.dipole = convert.D2Cm(num.array([-1.56, 0., 0.]))
+    param.rotcon = _Hz2J(3508.34e6, 703.50e6, 604.84e6)
+    param.dipole = _D2Cm(-1.56, 0., 0.)
 
 
 def three_fluorophenol(param):
@@ -766,30 +815,30 @@ def three_fluorophenol(param):
     .. todo:: YUan-Pin and Daniel, what are all the " (YPChang)" suppoed to say?
     """
     param.name = "three_fluorophenol"
-    param.mass = 6 * Masses['C'] + 1 * Masses['F'] + 1 * Masses['O'] + 5 * Masses['H']
+    param.mass = formula_mass(C=6, F=1, O=1, H=5)
     param.type = 'A'
     param.watson = 'S'
     param.symmetry = 'N'
     if param.isomer == 0:
-        param.rotcon = convert.Hz2J(num.array([3.78957e9, 1.79515e9, 1.21789e9]))
-        param.quartic = convert.Hz2J(num.array([-3.68e3,4.42e3,11e3,0.2,-3.2]))
-        param.dipole = convert.D2Cm(num.array([0.6251, 0.5345, 0.0025]))
+        param.rotcon = _Hz2J(3.78957e9, 1.79515e9, 1.21789e9)
+        param.quartic = _Hz2J(-3.68e3,4.42e3,11e3,0.2,-3.2)
+        param.dipole = _D2Cm(0.6251, 0.5345, 0.0025)
     elif param.isomer == 1:
-        param.rotcon = convert.Hz2J(num.array([3.748487e9, 1.797713e9, 1.215048e9]))
-        param.quartic = convert.Hz2J(num.array([0.2257e3,-10.977e3,-15.005e3,-0.2,7.2]))
-        param.dipole = convert.D2Cm(num.array([1.9206, 1.8098, 0.0001]))
+        param.rotcon = _Hz2J(3.748487e9, 1.797713e9, 1.215048e9)
+        param.quartic = _Hz2J(0.2257e3,-10.977e3,-15.005e3,-0.2,7.2)
+        param.dipole = _D2Cm(1.9206, 1.8098, 0.0001)
     elif param.isomer == 11:
-        param.rotcon = convert.Hz2J(num.array([3.74912e9, 1.78523e9, 1.20936e9]))
-        param.dipole = convert.D2Cm(num.array([0.6251, 0.5345, 0.0025]))
+        param.rotcon = _Hz2J(3.74912e9, 1.78523e9, 1.20936e9)
+        param.dipole = _D2Cm(0.6251, 0.5345, 0.0025)
     elif param.isomer == 12:
-        param.rotcon = convert.Hz2J(num.array([3.74222e9, 1.79016e9, 1.21090e9]))
-        param.dipole = convert.D2Cm(num.array([1.9206, 1.8098, 0.0001]))
+        param.rotcon = _Hz2J(3.74222e9, 1.79016e9, 1.21090e9)
+        param.dipole = _D2Cm(1.9206, 1.8098, 0.0001)
     elif param.isomer == 13:
-        param.rotcon = convert.Hz2J(num.array([3.76709624e9, 1.794471e9, 1.21547482e9]))
-        param.dipole = convert.D2Cm(num.array([0.276988, -0.781392, 0.0]))
+        param.rotcon = _Hz2J(3.76709624e9, 1.794471e9, 1.21547482e9)
+        param.dipole = _D2Cm(0.276988, -0.781392, 0.0)
     elif param.isomer == 14:
-        param.rotcon = convert.Hz2J(num.array([3.76358267e9, 1.79886976e9, 1.21712413e9]))
-        param.dipole = convert.D2Cm(num.array([2.747456, -0.144641, 0.0]))
+        param.rotcon = _Hz2J(3.76358267e9, 1.79886976e9, 1.21712413e9)
+        param.dipole = _D2Cm(2.747456, -0.144641, 0.0)
 
 
 def sulfur_dioxide(param):
@@ -804,10 +853,10 @@ def sulfur_dioxide(param):
     # A=2.026cm^-1, B=0.3442 cm^-1, C=0.2935 cm^-1.
     # Alternative papers: J. Chem. Phys. 19, 502 (1951), or  J. Chem. Phys. 22, 904 (1954). or
     # F.J. Lovas, J. Phys. Chem. Ref. Data 7, 1445 (1978).
-    param.rotcon = convert.Hz2J(num.array([60778.5522e6, 10318.0722e6, 8799.7023e6]))
+    param.rotcon = _Hz2J(60778.5522e6, 10318.0722e6, 8799.7023e6)
     # Alternative papers: F.J. Lovas, J. Phys. Chem. Ref. Data 7, 1445 (1978).
-    param.quartic = convert.Hz2J(num.array([0.0066610013e6, -0.1169588e6, 2.5904328e6, 0.001701045, 0.0253531]))
-    param.dipole = convert.D2Cm(num.array([0., 1.633189, 0.]))
+    param.quartic = _Hz2J(0.0066610013e6, -0.1169588e6, 2.5904328e6, 0.001701045, 0.0253531)
+    param.dipole = _D2Cm(0., 1.633189, 0.)
 
 
 def nitrogen_dioxide(param):
@@ -819,9 +868,9 @@ def nitrogen_dioxide(param):
     param.name = "nitrogen_dioxide"
     param.watson = 'A'
     param.symmetry = 'C2b'
-    param.rotcon = convert.Hz2J(num.array([239905.41e6, 13002.262e6, 12304.888e6]))
-    param.quartic = convert.Hz2J(num.array([9.033e3, -0.5903e6, 80.94e6, 9.303e2, 0.12e6]))
-    param.dipole = convert.D2Cm(num.array([0., 0.316, 0.]))
+    param.rotcon = _Hz2J(239905.41e6, 13002.262e6, 12304.888e6)
+    param.quartic = _Hz2J(9.033e3, -0.5903e6, 80.94e6, 9.303e2, 0.12e6)
+    param.dipole = _D2Cm(0., 0.316, 0.)
 
 
 def nitrous_oxide(param):
@@ -834,9 +883,9 @@ def nitrous_oxide(param):
     param.name = "nitrous_oxide"
     param.type = 'L'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([12561.6348e6]))
-    param.dipole = convert.D2Cm(num.array([0.160830]))
-    param.quartic  = convert.Hz2J(num.array([5.2808e6]))
+    param.rotcon = _Hz2J(12561.6348e6)
+    param.dipole = _D2Cm(0.160830)
+    param.quartic  = _Hz2J(5.2808e6)
 
 
 def methylvinylketone(param):
@@ -851,11 +900,11 @@ def methylvinylketone(param):
     param.type = 'A'
     param.symmetry = 'N'
     if param.isomer == 0: #cis
-        param.rotcon = convert.Hz2J(num.array([10.240938e9, 3.9916351e9, 2.925648e9]))
-        param.dipole = convert.D2Cm(num.array([0.54, 2.59, 0.]))
+        param.rotcon = _Hz2J(10.240938e9, 3.9916351e9, 2.925648e9)
+        param.dipole = _D2Cm(0.54, 2.59, 0.)
     elif param.isomer == 1: #trans
-        param.rotcon = convert.Hz2J(num.array([8.94159e9, 4.2745443e9, 2.9453315e9]))
-        param.dipole = convert.D2Cm(num.array([2.53, 1.91, 0.]))
+        param.rotcon = _Hz2J(8.94159e9, 4.2745443e9, 2.9453315e9)
+        param.dipole = _D2Cm(2.53, 1.91, 0.)
 
 
 def six_chloropyridazine_three_carbonitrile(param):
@@ -863,16 +912,16 @@ def six_chloropyridazine_three_carbonitrile(param):
 
     Gaussian 2003 B3LYP/aug-pc-1; see [Hansen2013]_"""
     param.name = "6-chloropyridazine-3-carbonitrile"
-    param.mass = 5 * Masses['C'] + 1 * Masses['Cl'] + 3 * Masses['N'] + 2 * Masses['H']
+    param.mass = formula_mass(C=5, Cl=1, N=3, H=2)
     param.type = 'A'
     param.watson = None
     param.symmetry = 'N'
     if param.isomer == 0:
-        param.rotcon = convert.Hz2J(num.array([5905.472e6, 717.422e6, 639.708e6]))
-        param.dipole = convert.D2Cm(num.array([0, 4.37, 2.83]))
+        param.rotcon = _Hz2J(5905.472e6, 717.422e6, 639.708e6)
+        param.dipole = _D2Cm(0, 4.37, 2.83)
     elif param.isomer == 1:
-        param.rotcon = convert.Hz2J(num.array([5905.472e6, 717.422e6, 639.708e6]))
-        param.dipole = convert.D2Cm(num.array([0, 0, 2.83]))
+        param.rotcon = _Hz2J(5905.472e6, 717.422e6, 639.708e6)
+        param.dipole = _D2Cm(0, 0, 2.83)
 
 
 def sulfur_monoxide(param):
@@ -882,11 +931,11 @@ def sulfur_monoxide(param):
     quartic: [Veseth1974]_
     """
     param.name = "sulfur_monoxide"
-    param.mass = Masses['S'] + Masses['O']
+    param.mass = formula_mass(S=1, O=1)
     param.type = 'L'
-    param.rotcon = convert.Hz2J(num.array([21.60970e9]))
-    param.dipole = convert.D2Cm(num.array([1.550]))
-    param.quartic  = convert.Hz2J(num.array([33.577e3]))
+    param.rotcon = _Hz2J(21.60970e9)
+    param.dipole = _D2Cm(1.550)
+    param.quartic  = _Hz2J(33.577e3)
 
 
 def carbon_monoxide(param):
@@ -896,10 +945,10 @@ def carbon_monoxide(param):
     quartic: [MinaCamilde1996]_
     """
     param.name = "carbon_monoxide"
-    param.mass = Masses['C'] + Masses['O']
+    param.mass = formula_mass(C=1, O=1)
     param.type = 'L'
-    param.rotcon = convert.Hz2J(num.array([57.89834e9]))
-    param.dipole = convert.D2Cm(num.array([0.11]))
+    param.rotcon = _Hz2J(57.89834e9)
+    param.dipole = _D2Cm(0.11)
     param.quartic  = convert.invcm2J(num.array([202.360e3]))
 
 
@@ -910,11 +959,11 @@ def five_cyanoindole(param):
     Dipole values calculated (aug-cc-pVTZ basis, see [Horke]_ for details)
     """
     param.name = "five_cyanoindole"
-    param.mass = 9 * Masses['C'] + 2 * Masses['N'] + 6 * Masses['H']
+    param.mass = formula_mass(C=9, N=2, H=6)
     param.watson = 'A'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([3370.4e6, 738.0e6, 605.93e6]))
-    param.dipole = convert.D2Cm(num.array([-6.44, -2.84, -0.33]))
+    param.rotcon = _Hz2J(3370.4e6, 738.0e6, 605.93e6)
+    param.dipole = _D2Cm(-6.44, -2.84, -0.33)
 
 
 def uracil(param):
@@ -927,12 +976,12 @@ def uracil(param):
     Good summary: [Puzzarini2011]_
     """
     param.name = "uracil"
-    param.mass = 4 * Masses['C'] + 4 * Masses['H'] + 2 * Masses['N'] + 2 * Masses['O']
+    param.mass = formula_mass(C=4, H=4, N=2, O=2)
     param.type = 'A'
     param.watson = 'S'
-    param.rotcon = convert.Hz2J(num.array([3883878.25e3, 2023732.67e3, 1330923.80e3]))
-    param.dipole = convert.D2Cm(num.array([1.61, 3.52, 0.0]))
-    param.quartic  = convert.Hz2J(num.array([0.06336e3, 0.1055e3, 0.4530e3, -0.02623e3, -0.00680e3]))
+    param.rotcon = _Hz2J(3883878.25e3, 2023732.67e3, 1330923.80e3)
+    param.dipole = _D2Cm(1.61, 3.52, 0.0)
+    param.quartic  = _Hz2J(0.06336e3, 0.1055e3, 0.4530e3, -0.02623e3, -0.00680e3)
 
 
 def mephenesin(param):
@@ -947,18 +996,18 @@ def mephenesin(param):
     """
 
     param.name = "mephenesin"
-    param.mass = 10 * Masses['C'] + 3 * Masses['O'] + 14 * Masses['H']
+    param.mass = formula_mass(C=10, O=3, H=14)
     param.watson = 'A'
     param.symmetry = 'N'
     if param.isomer == 0: #conformer A
-        param.rotcon = convert.Hz2J(num.array([1707.7896e6, 388.661705e6, 331.331684e6]))
-        param.dipole = convert.D2Cm(num.array([1.15, 0.56, 1.12]))
+        param.rotcon = _Hz2J(1707.7896e6, 388.661705e6, 331.331684e6)
+        param.dipole = _D2Cm(1.15, 0.56, 1.12)
     elif param.isomer == 1: #conformer B
-        param.rotcon = convert.Hz2J(num.array([1978.986e6, 349.300307e6, 305.408511e6]))
-        param.dipole = convert.D2Cm(num.array([-2.36, -0.48, -0.04]))
+        param.rotcon = _Hz2J(1978.986e6, 349.300307e6, 305.408511e6)
+        param.dipole = _D2Cm(-2.36, -0.48, -0.04)
     elif param.isomer == 2: #conformer C
-        param.rotcon = convert.Hz2J(num.array([1615.04911e6, 455.423567e6, 385.954447e6]))
-        param.dipole = convert.D2Cm(num.array([1.47, -1.32, -1.62]))
+        param.rotcon = _Hz2J(1615.04911e6, 455.423567e6, 385.954447e6)
+        param.dipole = _D2Cm(1.47, -1.32, -1.62)
 
 
 def hydrogen(param):
@@ -974,11 +1023,11 @@ def hydrogen(param):
     All polarizabilies are in SI units
     """
     param.name = "H2"
-    param.mass = 2 * Masses['H']
+    param.mass = formula_mass(H=2)
     param.type = 'L'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([1824.32704e9]))
-    param.dipole = convert.D2Cm(num.array([0.0]))
+    param.rotcon = _Hz2J(1824.32704e9)
+    param.dipole = _D2Cm(0.0)
     param.quartic  = convert.invcm2J(num.array([0.0460]))
     param.polarizability = num.array([11.1576e-41, 7.8225e-41])
 
@@ -999,11 +1048,11 @@ def hydrogen_deuteride(param):
 
     """
     param.name = "HD"
-    param.mass = Masses['H'] + Masses['D']
+    param.mass = formula_mass(H=1, D=1)
     param.type = 'L'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([1368.70247e9]))
-    param.dipole = convert.D2Cm(num.array([5.85e-4]))
+    param.rotcon = _Hz2J(1368.70247e9)
+    param.dipole = _D2Cm(5.85e-4)
     param.quartic  = convert.invcm2J(num.array([0.02586]))
     param.polarizability = num.array([11.0767e-41, 7.787e-41])
 
@@ -1024,11 +1073,11 @@ def deuterium(param):
 
     """
     param.name = "D2"
-    param.mass = 2 * Masses['D']
+    param.mass = formula_mass(D=2)
     param.type = 'L'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([912.67617e9]))
-    param.dipole = convert.D2Cm(num.array([0.0]))
+    param.rotcon = _Hz2J(912.67617e9)
+    param.dipole = _D2Cm(0.0)
     param.quartic  = convert.invcm2J(num.array([0.01153]))
     param.polarizability = num.array([10.9746e-41, 7.7421e-41])
 
@@ -1053,36 +1102,36 @@ def methane(param):
 
     """
     param.name = "methane"
-    param.mass = 4 * Masses['H'] + 1 * Masses['C']
+    param.mass = formula_mass(H=4, C=1)
     param.type = 'S'
     param.symmetry = 'p'
-    param.rotcon = convert.Hz2J(num.array([157.12722e9, 157.12722e9]))
-    param.dipole = convert.D2Cm(num.array([0.0]))
-    param.quartic  = convert.Hz2J(num.array([3.324e6, 135e3, 0.0]))
+    param.rotcon = _Hz2J(157.12722e9, 157.12722e9)
+    param.dipole = _D2Cm(0.0)
+    param.quartic  = _Hz2J(3.324e6, 135e3, 0.0)
     param.polarizability = num.array([2.724e-40, 0.0])
 
 
 def ammonia(param):
     print_incorrect_warning('ammonia', 'inversion splitting')
     param.name = "ammonia"
-    param.mass = 3 * Masses['H'] + 1 * Masses['N']
+    param.mass = formula_mass(H=3, N=1)
     param.type = 'S'
     param.symmetry = 'o'
     #values from MP2/6-31++g(d,p) level calculations for now. dipole moment from wiki...
-    param.rotcon = convert.Hz2J(num.array([2.98965765e+11, 1.88232489e+11]))
-    param.quartic  = convert.Hz2J(num.array([0.0, 0.0, 0.0]))
-    param.dipole = convert.D2Cm(num.array([1.42]))
+    param.rotcon = _Hz2J(2.98965765e+11, 1.88232489e+11)
+    param.quartic  = _Hz2J(0.0, 0.0, 0.0)
+    param.dipole = _D2Cm(1.42)
 
 
 def ammonia_dimer(param):
     param.name = "ammonia_dimer"
-    param.mass = 6 * Masses['H'] + 2 * Masses['N']
+    param.mass = formula_mass(H=6, N=2)
     param.type = 'S'
     param.symmetry = 'p'
     # values from MP2/6-31++g(d,p) level calculations for now. dipole moment from wiki...
-    param.rotcon = convert.Hz2J(num.array([1.18143309e+11,5.22172740e+09]))
-    param.quartic  = convert.Hz2J(num.array([0.0, 0.0, 0.0]))
-    param.dipole = convert.D2Cm(num.array([2.61]))
+    param.rotcon = _Hz2J(1.18143309e+11,5.22172740e+09)
+    param.quartic  = _Hz2J(0.0, 0.0, 0.0)
+    param.dipole = _D2Cm(2.61)
 
 
 def propylene_oxide(param):
@@ -1091,8 +1140,8 @@ def propylene_oxide(param):
     molecular constants are frome the CDMS database (date, link, ...?)
     """
     param.name = "propylene_oxide"
-    param.mass = 3 * Masses['C'] + 6 * Masses['H'] + 1 * Masses['O']
+    param.mass = formula_mass(C=3, H=6, O=1)
     param.watson = 'A'
     param.symmetry = 'N'
-    param.rotcon = convert.Hz2J(num.array([18023.89e6, 6682.14e6, 5951.39e6]))
-    param.dipole = convert.D2Cm(num.array([0.95, 1.67, 0.56]))
+    param.rotcon = _Hz2J(18023.89e6, 6682.14e6, 5951.39e6)
+    param.dipole = _D2Cm(0.95, 1.67, 0.56)
@@ -20,11 +20,29 @@ __author__ = "Jochen Küpper <jochen.kuepper@cfel.de>"
 import math
 import numpy as np
 import numpy.linalg
+import scipy.linalg.lapack
 
 import cmistark.convert
 import cmistark.molecule
 
 
+def _eigvalsh(hmat):
+    """Eigenvalues of the Hermitian matrix ``hmat``, in ascending order.
+
+    Calls the LAPACK relatively-robust-representation drivers (dsyevr/zheevr) directly with
+    compute_v=0; they are the fastest LAPACK eigensolvers when, as in all our Stark Hamiltonians,
+    only the eigenvalues are needed.
+    """
+    # lower=1: the Hamiltonian builders fill the lower triangle, as numpy.linalg.eigvalsh
+    # (UPLO='L') assumed; the raw LAPACK wrappers default to the upper one
+    if np.iscomplexobj(hmat):
+        eval, evec, m, isuppz, info = scipy.linalg.lapack.zheevr(hmat, compute_v=0, lower=1)
+    else:
+        eval, evec, m, isuppz, info = scipy.linalg.lapack.dsyevr(hmat, compute_v=0, lower=1)
+    assert 0 == info, "LAPACK eigensolver failed (info = %d)" % info
+    return eval
+
+
 
 
 class CalculationParameter(object):
@@ -61,6 +79,9 @@ class CalculationParameter(object):
 
     :param symmetry: defines the remaining symmetry of Hamiltonian for the molecule in a DC field.
 
+    :param processes: number of worker processes to distribute the calculation of the independent
+        dcfields over; 1 (the default) keeps the calculation in the calling process.
+
     **Rotor types**
 
     * 'L': linear top,
@@ -106,6 +127,9 @@ class CalculationParameter(object):
     quartic = np.zeros((5,), np.float64)
     dipole = np.zeros((3,), np.float64)
     polarizability = np.zeros((2,), np.float64)
+    # number of worker processes used for the Stark-field loop; the dcfields of one M are
+    # independent eigenvalue problems and are distributed over this many processes when > 1
+    processes = 1
     # internal
     debug = None
 
@@ -155,6 +179,19 @@ class Rotor(object):
         return self.levels[state.id()]
 
 
+    def energies(self):
+        """Return all calculated Stark energies at once.
+
+        :return: pair (ids, energies) of one-dimensional NumPy ndarrays covering all states for
+            which energies were calculated; ids are the State IDs.
+        """
+        if self.valid == False:
+            self.recalculate()
+        ids = np.fromiter(self.levels.keys(), dtype=np.uint64, count=len(self.levels))
+        energies = np.fromiter(self.levels.values(), dtype=np.float64, count=len(self.levels))
+        return ids, energies
+
+
     def statesymmetry(self, state):
         """Return symmetry for ``state``."""
         if self.valid == False:
@@ -214,7 +251,7 @@ class LinearRotor(Rotor):
         """Perform calculation of rotational state energies for current parameters"""
         hmat = self.hamiltonian(self.Jmin, self.Jmax, self.dcfield)
         if self.debug: self.print_mat(hmat, converter=cmistark.convert.J2Hz)
-        eval = np.linalg.eigvalsh(hmat) # calculate only energies
+        eval = _eigvalsh(hmat) # calculate only energies
         eval = np.sort(eval)
         if self.debug:
             eval, evec = np.linalg.eigh(hmat)
@@ -246,8 +283,8 @@ class LinearRotor(Rotor):
     def fieldfree(self, hmat, Jmin, Jmax):
         """Add the field-free-rotor matrix element terms to hmat"""
         matrixsize_Jmin = Jmin *(Jmin-1) + Jmin
-        B = float(self.rotcon)
-        D = float(self.quartic)
+        B = self.rotcon[0]
+        D = self.quartic[0]
         for J in range(Jmin, Jmax+1):
             hmat[self.index(J), self.index(J)] += B * J*(J+1) - D * (J*(J+1))**2
 
@@ -256,7 +293,7 @@ class LinearRotor(Rotor):
         """Add the dc Stark-effect matrix element terms to hmat"""
         sqrt = np.sqrt
         M = self.M
-        mu = float(self.dipole)
+        mu = self.dipole[0]
         for J in range(Jmin, Jmax):
             value = -mu * dcfield * sqrt((J+1)**2 - M**2) / sqrt((2*J+1) * (2*J+3))
             hmat[self.index(J+1), self.index(J)] += value
@@ -358,7 +395,7 @@ class SymmetricRotor(Rotor):
         self.levels = {}
         for K in range(-self.Jmax, self.Jmax+1): # scan K
             blocks = self.hamiltonian(self.Jmin, self.Jmax, self.dcfield, K) # create a full hamt for a single K. (note not |K|.)
-            eval = np.linalg.eigvalsh(blocks) # calculate only energies
+            eval = _eigvalsh(blocks) # calculate only energies
             eval = np.sort(eval)
             i = 0
             for state in self.stateorder(K):
@@ -406,7 +443,7 @@ class SymmetricRotor(Rotor):
         """Add the dc Stark-effect matrix element terms to hmat"""
         sqrt = np.sqrt
         M = self.M
-        mu = float(self.dipole)
+        mu = self.dipole[0]
         for J in range(max(Jmin, abs(K)), Jmax):
             # diagonal term
             if not (0 == M or 0 == K): # term would be zero; this also yields J !=0, so no division by zero possible
@@ -532,7 +569,7 @@ class AsymmetricRotor(Rotor):
         blocks = self.hamiltonian(self.Jmin, self.Jmax, self.dcfield, self.symmetry)
         for symmetry in list(blocks.keys()):
             # if None is not self.debug: self.print_mat(blocks[symmetry], "\nSymmetry: " + symmetry)
-            eval = np.linalg.eigvalsh(blocks[symmetry]) # calculate only energies
+            eval = _eigvalsh(blocks[symmetry]) # calculate only energies
             i = 0
             for state in self.stateorder(symmetry):
                 if state.J() <= self.Jmax_save:
@@ -717,7 +754,7 @@ class AsymmetricRotor(Rotor):
                 # store sorted eigenenergies for respective J and block
                 for sym in list(blocks.keys()):
                     if 0 < blocks[sym].size:
-                        eigenvalues[sym] += np.sort(np.linalg.eigvalsh(np.array(blocks[sym]))).tolist()
+                        eigenvalues[sym] += np.sort(_eigvalsh(np.array(blocks[sym]))).tolist()
             # sort assignments according to energy
             if 'Wa' == self.symmetry:
                 symmetries = ['Ep', 'Em', 'Op', 'Om']
@@ -1186,6 +1223,14 @@ class AsymmetricRotor(Rotor):
                 hmat[self.index(J, K), self.index(J, K+4)] += value
 
 
+# rotor classes implementing the Stark-energy calculation, by CalculationParameter.type; defined
+# here, below the classes, so importing cmistark.starkeffect first keeps working despite the
+# circular import with cmistark.molecule
+_ROTORS = {'L': LinearRotor,
+           'S': SymmetricRotor,
+           'A': AsymmetricRotor}
+
+
 # some simple tests
 if __name__ == "__main__":
     pass
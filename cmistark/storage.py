@@ -24,6 +24,12 @@ import numpy as np
 import tables
 
 
+# Default filters for the Stark-energy datasets. Note that the curve data itself lives in the HDF5
+# variable-length heap, which filters do not touch -- changing the compressor here does not change
+# the stored curves, so we keep the traditional setting.
+_default_filters = tables.Filters(complevel=1, complib='zlib')
+
+
 def column_merge(list1, list2, column=0):
     """Merge two lists of 1D arrays (vectors) according to the values in one |column| of the two. Entries of equal
     base-values are reduced to the one in list1. The resulting vectors are in random order.
@@ -103,25 +109,18 @@ def readVLArray(file, name):
 
 def read_vlarray(file, name):
     array = file.get_node(name)
-    return np.array(array.read())[0]
+    # read() already yields a list of NumPy arrays; return the single row without an extra copy
+    return array.read()[0]
 
 
 def writeVLArray(file, groupname, leafname, data, comment="", atom=tables.Float64Atom(shape=()),
-                 filters=tables.Filters(complevel=1, complib='zlib')):
+                 filters=_default_filters):
     return write_vlarray(file, groupname, leafname, data, comment, atom, filters)
 
 
 
-def write_vlarray(file, groupname, leafname, data, comment="", atom=tables.Float64Atom(shape=()),
-                 filters=tables.Filters(complevel=1, complib='zlib')):
-    """
-    Write a single array, corresponding, for instance, to a single Stark curve, to the storage file.
-
-    We only use zlib-compression at level 1, because that's apparently as good as any higher level, but should be
-    faster. Moreover, we rely on PyTables automatically turning on the HDF5 shuffle filter, what it does when any
-    compression is turned on.
-    """
-    # make sure the group-tree exists
+def get_or_create_group(file, groupname):
+    """Get the group ``groupname`` of the storage file, creating missing groups along the path."""
     group = file.root
     for name in groupname.split('/'):
         try:
@@ -131,12 +130,33 @@ def write_vlarray(file, groupname, leafname, data, comment="", atom=tables.Float
                 group = file.create_group(group, name)
             except tables.exceptions.NodeError:
                 assert False, "Stark storage error: cannot create non-existing group %s from %s!" % (name, groupname)
+    return group
+
+
+def write_vlarray(file, groupname, leafname, data, comment="", atom=tables.Float64Atom(shape=()),
+                 filters=_default_filters):
+    """
+    Write a single array, corresponding, for instance, to a single Stark curve, to the storage file.
+
+    ``groupname`` can be the path of the group or an already retrieved Group node, which allows
+    callers to avoid repeated traversals of the HDF5 tree.
+
+    Every VLArray holds exactly one row (one Stark curve), so we announce that through
+    ``expectedrows``; the default of 10000 expected rows would make PyTables choose an oversized
+    chunk, blowing up the per-state HDF5 metadata for the many tiny datasets we store.
+
+    The new leaf is not flushed here; callers batch many writes and flush the file once, for
+    instance per M in Molecule.starkeffect_calculation.
+    """
+    # make sure the group-tree exists
+    if isinstance(groupname, tables.Group):
+        group = groupname
+    else:
+        group = get_or_create_group(file, groupname)
     # if the dataset exists already, delete it
     try:
         file.remove_node(group, leafname)
-    except tables.exceptions.NodeError as xxx_todo_changeme:
-        tables.exceptions.NoSuchNodeError = xxx_todo_changeme
+    except tables.exceptions.NodeError:
         pass
-    array = file.create_vlarray(group, leafname, atom, comment, filters)
+    array = file.create_vlarray(group, leafname, atom, comment, filters, expectedrows=1)
     array.append(data)
-    array.flush()
@@ -107,5 +107,63 @@ class StarkCalculationBenzonitrile(unittest.TestCase):
                                   convert.J2Hz(self.bn.starkeffect(State(0, 0, 0, 0, 0))[1][4])/1e6))
 
 
+class StarkCalculationNoSymmetry(unittest.TestCase):
+    """Test Stark effect calculations without remaining symmetry (symmetry 'N')
+
+    A full dipole vector leaves no symmetry to exploit and makes the Hamiltonian complex, so this
+    covers the solver path for complex Hermitian matrices, which the benzonitrile test (C2a, real
+    symmetric) does not.
+    """
+
+    @classmethod
+    def setUpClass(self):
+        """Run before the first test"""
+        # set molecular parameters -- benzonitrile rotational constants with an artificial dipole
+        self.param = starkeffect.CalculationParameter
+        self.param.isomer = 0
+        self.param.type = 'A'
+        self.param.watson = 'A'
+        self.param.symmetry = 'N'
+        self.param.rotcon = convert.Hz2J(np.array([5655.2654e6, 1546.875864e6, 1214.40399e6]))
+        self.param.quartic = convert.Hz2J(np.array([45.6, 938.1, 500, 10.95, 628]))
+        self.param.dipole = convert.D2Cm(np.array([4.5152, 1.0, 0.5]))
+        # calculation details
+        self.param.M = [0, 1]
+        self.param.Jmin = 0
+        self.param.Jmax_calc = 15
+        self.param.Jmax_save =  3
+        self.param.dcfields = convert.kV_cm2V_m(np.linspace(0., 100., 5))
+        # create Molecule object and specify storage file
+        self.param.name = "__cmistark_test_starkeffect_N"
+        self.storagename = self.param.name + ".molecule"
+        if os.path.exists(self.storagename):
+            raise EnvironmentError("Test storage file already exists, not overwriting")
+        self.mol = molecule.Molecule(storage=self.storagename, name=self.param.name)
+        # calculate Stark energies
+        self.mol.starkeffect_calculation(self.param)
+
+
+    @classmethod
+    def tearDownClass(self):
+        """Run after the last test"""
+        del(self.mol)
+        os.remove(self.storagename)
+
+
+    def test_hundred(self):
+        """Test some state energies at 100 kV/cm
+
+        The reference values were computed with numpy.linalg.eigvalsh (UPLO='L') on the same
+        Hamiltonians; these matrices are only Hermitian in their lower triangle, so an eigensolver
+        reading the wrong triangle fails this test by tens of percent.
+        """
+        self.assertAlmostEqual(1., -1.382127986526119e-22 / self.mol.starkeffect(State(0, 0, 0, 0, 0))[1][4], 7,
+                               "Ground state energy is wrong")
+        self.assertAlmostEqual(1., -1.3483504812618911e-22 / self.mol.starkeffect(State(1, 0, 1, 1, 0))[1][4], 7,
+                               "1_01, M=1 state energy is wrong")
+        self.assertAlmostEqual(1., -8.827631904678831e-23 / self.mol.starkeffect(State(2, 1, 1, 1, 0))[1][4], 7,
+                               "2_11, M=1 state energy is wrong")
+
+
 if __name__ == '__main__':
     unittest.main()